@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import os
+import re
 from typing import Any, Dict
 
 
+# Anchored to the start of a whitespace run; unanchored, mid-line runs backtrack quadratically
+_TRAILING_WS_RE = re.compile(r"(?<![^\S\n])[^\S\n]+$", re.MULTILINE)
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
 def ai_enabled() -> bool:
     return bool((os.getenv("OPENAI_API_KEY") or "").strip())
 
@@ -16,18 +22,10 @@ def _local_cleanup(text: str) -> str:
     if not text:
         return ""
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = [ln.rstrip() for ln in text.split("\n")]
-    out = []
-    blank = 0
-    for ln in lines:
-        if ln.strip() == "":
-            blank += 1
-            if blank <= 1:
-                out.append("")
-        else:
-            blank = 0
-            out.append(ln)
-    return "\n".join(out).strip()
+    # Right-strip every line and collapse runs of blank lines to one, in two C-level passes
+    text = _TRAILING_WS_RE.sub("", text)
+    text = _BLANK_RUN_RE.sub("\n\n", text)
+    return text.strip()
 
 
 def _call_openai(messages: list[dict], temperature: float = 0.2) -> str:
@@ -5,20 +5,20 @@ from typing import Tuple
 
 import streamlit as st
 
-from core.rfp import parse_rfp_from_pdf_bytes, ParsedRFP
+from core.rfp import parse_rfp_from_pdf_bytes
 
 
 def _hash_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
+    return hashlib.blake2b(b, digest_size=16).hexdigest()
 
 
-@st.cache_data(show_spinner=False)
-def cached_parse(pdf_hash: str, pdf_bytes: bytes, max_pages_to_read: int) -> ParsedRFP:
-    # pdf_hash is included so cache invalidates when file changes
-    return parse_rfp_from_pdf_bytes(pdf_bytes, max_pages_to_read=max_pages_to_read)
+@st.cache_data(show_spinner=False, max_entries=8)
+def cached_parse(pdf_hash: str, _pdf_bytes: bytes, max_pages_to_read: int) -> Tuple[int, str]:
+    # pdf_hash is the cache key; the leading underscore keeps Streamlit from re-hashing the raw bytes
+    return parse_rfp_from_pdf_bytes(_pdf_bytes, max_pages_to_read=max_pages_to_read)
 
 
-def analyze_pdf(pdf_bytes: bytes, max_pages_to_read: int) -> Tuple[ParsedRFP, str]:
+def analyze_pdf(pdf_bytes: bytes, max_pages_to_read: int) -> Tuple[Tuple[int, str], str]:
     h = _hash_bytes(pdf_bytes)
     parsed = cached_parse(h, pdf_bytes, max_pages_to_read)
     return parsed, h
\ No newline at end of file
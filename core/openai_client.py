@@ -1,16 +1,17 @@
 import os
 from typing import Optional, Any
 
-try:
-    from openai import OpenAI
-except Exception:
-    OpenAI = None
 
 def get_openai_client() -> Optional[Any]:
     """
     Returns OpenAI client if OPENAI_API_KEY exists and SDK is installed.
+    The SDK is only imported once a key is present.
     """
     key = os.getenv("OPENAI_API_KEY", "").strip()
-    if not key or OpenAI is None:
+    if not key:
+        return None
+    try:
+        from openai import OpenAI
+    except Exception:
         return None
     return OpenAI(api_key=key)
\ No newline at end of file
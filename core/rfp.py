@@ -4,68 +4,167 @@ import re
 from io import BytesIO
 from typing import Dict, List, Tuple
 
-from pypdf import PdfReader
-
 
 CERTS = ["SDVOSB", "8(a)", "WOSB", "HUBZone", "VOSB", "SDB", "ISO", "CMMC"]
+_CERTS_UPPER = [(c, c.upper()) for c in CERTS]
+# All certs in one pass. Zero-width lookahead so overlapping names (VOSB inside SDVOSB) both register.
+CERTS_RE = re.compile(
+    "(?=(" + "|".join(re.escape(c) for c in sorted(CERTS, key=len, reverse=True)) + "))",
+    re.IGNORECASE,
+)
+
+
+EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+DUE_DATE_RES = [
+    re.compile(r"\b(0?[1-9]|1[0-2])/(0?[1-9]|[12]\d|3[01])/(20\d{2})\b", re.IGNORECASE),
+    re.compile(
+        r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},\s+20\d{2}\b",
+        re.IGNORECASE,
+    ),
+]
+NAICS_RE = re.compile(r"\bNAICS\s*[:#]?\s*(\d{6})\b", re.IGNORECASE)
 
 
 def _extract_email(text: str) -> str:
-    m = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", text or "")
+    m = EMAIL_RE.search(text or "")
     return m.group(0) if m else ""
 
 
 def _extract_due_date(text: str) -> str:
-    patterns = [
-        r"\b(0?[1-9]|1[0-2])/(0?[1-9]|[12]\d|3[01])/(20\d{2})\b",
-        r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},\s+20\d{2}\b",
-    ]
-    for p in patterns:
-        m = re.search(p, text or "", flags=re.IGNORECASE)
+    for p in DUE_DATE_RES:
+        m = p.search(text or "")
         if m:
             return m.group(0)
     return ""
 
 
 def _extract_naics(text: str) -> str:
-    m = re.search(r"\bNAICS\s*[:#]?\s*(\d{6})\b", text or "", flags=re.IGNORECASE)
+    m = NAICS_RE.search(text or "")
     return m.group(1) if m else ""
 
 
 def _extract_certs(text: str) -> List[str]:
-    found: List[str] = []
-    t = (text or "").upper()
-    for c in CERTS:
-        if c.upper() in t:
-            found.append(c)
-    out: List[str] = []
-    for x in found:
-        if x not in out:
-            out.append(x)
-    return out
+    hits = {m.group(1).upper() for m in CERTS_RE.finditer(text or "")}
+    return [c for c, c_upper in _CERTS_UPPER if c_upper in hits]
 
 
-def parse_rfp_from_pdf_bytes(pdf_bytes: bytes, max_pages_to_read: int = 40) -> Tuple[int, str]:
+# Scanned-PDF probe: leading pages to sample, stride through the rest,
+# and max real chars for the sample to still count as scanned
+_SCAN_SAMPLE_PAGES = 5
+_SCAN_PROBE_STRIDE = 4
+_SCAN_MAX_SAMPLE_CHARS = 200
+
+
+def _text_chars(text: str) -> int:
+    # Characters that carry content: no whitespace, no U+FFFD from undecodable glyphs
+    return sum(1 for ch in text if not ch.isspace() and ch != "\ufffd")
+
+
+def _probe_indices(n: int) -> List[int]:
+    # First pages, every few pages through the middle, and the last two.
+    # Any text body longer than the stride lands on at least one probed page.
+    idx = set(range(min(n, _SCAN_SAMPLE_PAGES)))
+    idx |= set(range(_SCAN_SAMPLE_PAGES, n, _SCAN_PROBE_STRIDE))
+    idx |= set(range(max(0, n - 2), n))
+    return sorted(idx)
+
+
+def _probe_pages(doc, n: int) -> Tuple[bool, Dict[int, str]]:
     """
-    Returns (total_pages, extracted_text).
-    IMPORTANT: PdfReader expects a file-like object, so we wrap bytes in BytesIO.
+    Walks the text blocks of the probe pages once. Returns whether the PDF looks
+    scanned (every probed page image-dominated and almost no real text overall),
+    plus each probed page's text so the caller never extracts those pages twice.
     """
+    chars = 0
+    all_image = True
+    probed: Dict[int, str] = {}
+    for i in _probe_indices(n):
+        text_area = 0.0
+        img_area = 0.0
+        page_text = ""
+        try:
+            page = doc.load_page(i)
+            for x0, y0, x1, y1, block_text, _, block_type in page.get_text("blocks"):
+                if block_type == 0:
+                    page_text += block_text
+                    text_area += (x1 - x0) * (y1 - y0)
+            for img in page.get_image_info():
+                x0, y0, x1, y1 = img["bbox"]
+                img_area += (x1 - x0) * (y1 - y0)
+        except Exception:
+            page_text = ""
+        chars += _text_chars(page_text)
+        all_image = all_image and img_area > 3 * text_area
+        probed[i] = page_text
+    return all_image and chars < _SCAN_MAX_SAMPLE_CHARS, probed
+
+
+def _parse_with_fitz(pdf_bytes: bytes, max_pages_to_read: int) -> Tuple[int, str]:
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        total_pages = doc.page_count
+        n = min(total_pages, max_pages_to_read)
+        scanned, probed = _probe_pages(doc, n)
+        if scanned:
+            # Don't walk the rest, but keep whatever text the sample did have
+            return total_pages, "\n".join(probed.values()).strip()
+
+        parts: List[str] = []
+        for i in range(n):
+            if i in probed:
+                parts.append(probed[i])
+                continue
+            try:
+                parts.append(doc.load_page(i).get_text("text") or "")
+            except Exception:
+                parts.append("")
+
+    text = "\n".join(parts).strip()
+    return total_pages, text
+
+
+def _parse_with_pypdf(pdf_bytes: bytes, max_pages_to_read: int) -> Tuple[int, str]:
+    from pypdf import PdfReader
+
+    # PdfReader expects a file-like object, so we wrap bytes in BytesIO.
     stream = BytesIO(pdf_bytes)
     reader = PdfReader(stream)
     total_pages = len(reader.pages)
 
     n = min(total_pages, max_pages_to_read)
-    parts: List[str] = []
-    for i in range(n):
+
+    def _page_text(i: int) -> str:
         try:
-            parts.append(reader.pages[i].extract_text() or "")
+            return reader.pages[i].extract_text() or ""
         except Exception:
-            parts.append("")
+            return ""
+
+    # Probe a spread of pages before walking everything; no text layer on
+    # any of them means a scanned PDF, so skip the full pass.
+    probed = {i: _page_text(i) for i in _probe_indices(n)}
+    if sum(_text_chars(t) for t in probed.values()) == 0:
+        return total_pages, ""
+
+    parts = [probed[i] if i in probed else _page_text(i) for i in range(n)]
 
     text = "\n".join(parts).strip()
     return total_pages, text
 
 
+def parse_rfp_from_pdf_bytes(pdf_bytes: bytes, max_pages_to_read: int = 40) -> Tuple[int, str]:
+    """
+    Returns (total_pages, extracted_text).
+    Uses PyMuPDF when installed (C-backed, much faster); falls back to pypdf otherwise
+    or if PyMuPDF cannot open the file.
+    """
+    try:
+        return _parse_with_fitz(pdf_bytes, max_pages_to_read)
+    except Exception:
+        # PyMuPDF not installed, or it could not open the file
+        return _parse_with_pypdf(pdf_bytes, max_pages_to_read)
+
+
 def extract_fields_from_text(text: str) -> Dict[str, str | List[str]]:
     return {
         "due_date": _extract_due_date(text),
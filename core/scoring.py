@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import Dict, List, Tuple
 
 from core.state import get_company, get_rfp
@@ -131,7 +132,7 @@ def compute_scores() -> Dict[str, object]:
 
     # Certifications alignment (soft eligibility)
     required = [c.upper() for c in (rfp.certifications_required or [])]
-    have = [c.upper() for c in (company.certifications or [])]
+    have = {c.upper() for c in (company.certifications or [])}
     missing_required = [c for c in required if c not in have]
 
     # Eligibility logic: warn, don’t block
@@ -156,9 +157,8 @@ def compute_scores() -> Dict[str, object]:
         add_yellow("Certifications not detected", "No certification requirements detected in the RFP text sample.")
 
     # --- Compute compliance %
-    green = sum(1 for it in items if it["status"] == "green")
-    yellow = sum(1 for it in items if it["status"] == "yellow")
-    red = sum(1 for it in items if it["status"] == "red")
+    tally = Counter(it["status"] for it in items)
+    green, yellow, red = tally["green"], tally["yellow"], tally["red"]
 
     total = max(1, len(items))
     compliance_pct = _clamp(int((green / total) * 100))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 import streamlit as st
 
@@ -17,8 +17,6 @@ class RFPState:
     submission_email: str = ""
     certifications_required: List[str] = field(default_factory=list)
     naics: str = ""
-    # raw
-    pdf_bytes: Optional[bytes] = None
 
 
 @dataclass
@@ -5,17 +5,15 @@ from typing import List, Dict, Any
 
 
 def get_requirements_rows(reqs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    rows = []
-    for r in (reqs or []):
-        rows.append(
-            {
-                "requirement_id": r.get("requirement_id", ""),
-                "requirement": r.get("requirement", ""),
-                "status": r.get("status", "Open"),
-                "notes": r.get("notes", ""),
-            }
-        )
-    return rows
+    return [
+        {
+            "requirement_id": r.get("requirement_id", ""),
+            "requirement": r.get("requirement", ""),
+            "status": r.get("status", "Open"),
+            "notes": r.get("notes", ""),
+        }
+        for r in (reqs or [])
+    ]
 
 
 def build_compatibility_matrix_xlsx(rows: List[Dict[str, Any]]) -> bytes:
@@ -1,10 +1,78 @@
 from __future__ import annotations
 
+from copy import deepcopy
+from functools import lru_cache
 from io import BytesIO
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from docx import Document
-from docx.shared import Inches
+
+# python-docx is imported inside the functions below so app start-up
+# (which imports every page) doesn't pay for it until the first export.
+
+
+@lru_cache(maxsize=None)
+def _oxml_templates() -> Dict[str, Any]:
+    """
+    Prototype elements, parsed once and deep-copied per use.
+    """
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    w = nsdecls("w")
+    return {
+        "p": parse_xml(f"<w:p {w}/>"),
+        "r": parse_xml(f"<w:r {w}/>"),
+        "t": parse_xml(f'<w:t {w} xml:space="preserve"/>'),
+        "br": parse_xml(f"<w:br {w}/>"),
+        "tab": parse_xml(f"<w:tab {w}/>"),
+    }
+
+
+def _add_paragraph_lines(doc: Any, text: str) -> None:
+    """
+    Consecutive non-blank lines become one paragraph joined by <w:br/>; each blank
+    line stays an empty paragraph, so the text's blank-line spacing carries over
+    with one paragraph per block instead of one per line.
+    """
+    tpl = _oxml_templates()
+    body = doc.element.body
+    sect_pr = body.sectPr
+
+    def _emit(p: Any) -> None:
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
+    block: List[str] = []
+
+    def _flush() -> None:
+        if not block:
+            return
+        p = deepcopy(tpl["p"])
+        r = deepcopy(tpl["r"])
+        p.append(r)
+        for i, line in enumerate(block):
+            if i:
+                r.append(deepcopy(tpl["br"]))
+            for j, seg in enumerate(line.split("\t")):
+                if j:
+                    r.append(deepcopy(tpl["tab"]))
+                if seg:
+                    t = deepcopy(tpl["t"])
+                    t.text = seg
+                    r.append(t)
+        _emit(p)
+        block.clear()
+
+    text = (text or "").replace("\r\n", "\n").replace("\r", "\n")
+    for line in text.split("\n"):
+        if line:
+            block.append(line)
+        else:
+            _flush()
+            _emit(deepcopy(tpl["p"]))
+    _flush()
 
 
 def build_docx_bytes(
@@ -15,6 +83,9 @@ def build_docx_bytes(
     proposal_body: str,
     logo_bytes: Optional[bytes] = None,
 ) -> bytes:
+    from docx import Document
+    from docx.shared import Inches
+
     doc = Document()
 
     if logo_bytes:
@@ -36,14 +107,12 @@ def build_docx_bytes(
     doc.add_page_break()
 
     doc.add_heading("Cover Letter", level=1)
-    for line in (cover_letter or "").split("\n"):
-        doc.add_paragraph(line)
+    _add_paragraph_lines(doc, cover_letter)
 
     doc.add_page_break()
 
     doc.add_heading("Proposal", level=1)
-    for line in (proposal_body or "").split("\n"):
-        doc.add_paragraph(line)
+    _add_paragraph_lines(doc, proposal_body)
 
     bio = BytesIO()
     doc.save(bio)
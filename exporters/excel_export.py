@@ -3,11 +3,11 @@ from __future__ import annotations
 from io import BytesIO
 from typing import List, Dict, Any
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
-
 
 def build_matrix_xlsx(compatibility_rows: List[Dict[str, Any]]) -> bytes:
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
     wb = Workbook()
     ws = wb.active
     ws.title = "Compatibility Matrix"
@@ -143,16 +143,14 @@ def evaluator_panel(diagnostics: dict) -> None:
     c2.metric("Yellow", int(counts.get("yellow", 0)))
     c3.metric("Red", int(counts.get("red", 0)))
 
-    for item in items:
-        status = (item.get("status") or "yellow").lower()
-        label = item.get("label") or "Check"
-        hint = item.get("hint") or ""
-
-        icon = "🟡"
-        if status == "green":
-            icon = "🟢"
-        elif status == "red":
-            icon = "🔴"
-
-        with st.expander(f"{icon} {label}", expanded=False):
-            st.write(hint or "No details provided.")
\ No newline at end of file
+    icons = {"green": "🟢", "yellow": "🟡", "red": "🔴"}
+    rows = [
+        {
+            "Status": icons.get((item.get("status") or "yellow").lower(), "🟡"),
+            "Check": item.get("label") or "Check",
+            "Details": item.get("hint") or "No details provided.",
+        }
+        for item in items
+    ]
+    # One table widget instead of an expander per item
+    st.dataframe(rows, hide_index=True, use_container_width=True)
\ No newline at end of file
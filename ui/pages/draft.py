@@ -7,16 +7,7 @@ from core.ai import ai_enabled, polish_for_submission
 from ui.components import section_header, warn_box, ok_box, badge
 
 
-def _basic_generate(company: dict, rfp: dict) -> tuple[str, str]:
-    name = (company.get("name") or "").strip() or "[Company Name]"
-    uei = (company.get("uei") or "").strip() or "[UEI]"
-    cage = (company.get("cage") or "").strip() or "[CAGE]"
-    certs = ", ".join(company.get("certifications") or []) or "[Certifications]"
-    due = (rfp.get("due_date") or "").strip() or "[Due Date]"
-    sub = (rfp.get("submission_email") or "").strip() or "[Submission Email/Method]"
-    rfp_name = (rfp.get("filename") or "").strip() or "Solicitation"
-
-    cover = f"""Subject: Proposal Submission – {rfp_name}
+_COVER_TEMPLATE = """Subject: Proposal Submission – {rfp_name}
 
 Dear Contracting Officer,
 
@@ -31,7 +22,7 @@ Respectfully,
 {name}
 """
 
-    body = f"""1. Executive Summary
+_BODY_TEMPLATE = """1. Executive Summary
 {name} submits this proposal to support the Government’s requirement. Our approach emphasizes compliance, accountability, and measurable execution.
 
 2. Company Overview
@@ -46,12 +37,26 @@ Respectfully,
 [Add staffing plan, management approach, and quality control.]
 
 5. Past Performance
-{company.get("past_performance") or "[Add past performance]"}
+{past_perf}
 
 6. Differentiators
-{company.get("differentiators") or "[Add differentiators]"}
+{diffs}
 """
-    return cover, body
+
+
+def _basic_generate(company: dict, rfp: dict) -> tuple[str, str]:
+    ctx = {
+        "name": (company.get("name") or "").strip() or "[Company Name]",
+        "uei": (company.get("uei") or "").strip() or "[UEI]",
+        "cage": (company.get("cage") or "").strip() or "[CAGE]",
+        "certs": ", ".join(company.get("certifications") or []) or "[Certifications]",
+        "due": (rfp.get("due_date") or "").strip() or "[Due Date]",
+        "sub": (rfp.get("submission_email") or "").strip() or "[Submission Email/Method]",
+        "rfp_name": (rfp.get("filename") or "").strip() or "Solicitation",
+        "past_perf": company.get("past_performance") or "[Add past performance]",
+        "diffs": company.get("differentiators") or "[Add differentiators]",
+    }
+    return _COVER_TEMPLATE.format_map(ctx), _BODY_TEMPLATE.format_map(ctx)
 
 
 def render() -> None:
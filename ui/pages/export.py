@@ -7,6 +7,19 @@ from exporters.docx_export import build_docx_bytes
 from ui.components import section_header, warn_box, badge
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_docx_bytes(
+    rfp: dict, company: dict, cover_letter: str, proposal_body: str, logo_bytes: bytes | None
+) -> bytes:
+    return build_docx_bytes(
+        rfp=rfp,
+        company=company,
+        cover_letter=cover_letter,
+        proposal_body=proposal_body,
+        logo_bytes=logo_bytes,
+    )
+
+
 def render() -> None:
     rfp = get_rfp()
     company = get_company()
@@ -30,12 +43,14 @@ def render() -> None:
             st.rerun()
         return
 
-    docx_bytes = build_docx_bytes(
-        rfp=rfp.__dict__,
-        company=company.__dict__,
-        cover_letter=cover,
-        proposal_body=body,
-        logo_bytes=st.session_state.get("company_logo_bytes"),
+    # Rebuilt only when an input changes, not on every rerun of this page.
+    # Only the fields the exporter reads go into the key (not the full RFP text/PDF).
+    docx_bytes = _cached_docx_bytes(
+        {"filename": rfp.filename, "due_date": rfp.due_date, "submission_email": rfp.submission_email},
+        {"name": company.name},
+        cover,
+        body,
+        st.session_state.get("company_logo_bytes"),
     )
 
     st.download_button(
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import streamlit as st
 
-from core.rfp import parse_rfp_from_pdf_bytes, extract_fields_from_text
+from core.analyze import analyze_pdf
+from core.rfp import extract_fields_from_text
 from core.state import get_rfp, set_rfp, set_current_step, mark_complete
 from ui.components import section_header, warn_box, ok_box, badge
 
@@ -40,7 +41,7 @@ def render() -> None:
 
         if pdf_bytes:
             with st.spinner("Reading PDF and extracting text..."):
-                pages_total, text = parse_rfp_from_pdf_bytes(pdf_bytes, max_pages_to_read=60)
+                (pages_total, text), _ = analyze_pdf(pdf_bytes, max_pages_to_read=60)
 
         if not text.strip() and pasted_text.strip():
             text = pasted_text.strip()
@@ -49,7 +50,6 @@ def render() -> None:
 
         # Update state
         rfp.filename = filename
-        rfp.pdf_bytes = pdf_bytes
         rfp.pages = pages_total
         rfp.text = text
         rfp.extracted = bool(text.strip())